@@ -14,14 +14,16 @@ Environment Variables:
                        Falls back to mock data on failure or if unset.
 """
 
+import logging
 import os
-from datetime import datetime, timezone
+import time
 from typing import Optional
 
 from fastapi import APIRouter, Query
 from fastapi.responses import JSONResponse
 
 router = APIRouter(prefix="/api/command-deck", tags=["command-deck-api"])
+logger = logging.getLogger("nautical_compass.command_deck")
 
 # ---------------------------------------------------------------------------
 # /api/command-deck/status
@@ -43,7 +45,7 @@ MOCK_STATUS = {
 def command_deck_status():
     """Return current system state metrics for the Command Deck dials."""
     data = dict(MOCK_STATUS)
-    data["last_updated"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    data["last_updated"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
     return JSONResponse(content=data)
 
 
@@ -111,6 +113,7 @@ def _fetch_live_weather(lat: float, lon: float) -> dict | None:
             "source": "live",
         }
     except Exception:
+        logger.exception("Live weather fetch failed")
         return None
 
 
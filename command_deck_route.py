@@ -29,6 +29,11 @@ def _get_build_hash() -> str:
         return "unknown"
 
 
+# Neither changes while the process runs, so resolve them once at import.
+BUILD_HASH = _get_build_hash()
+BUILD_TIME = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+
+
 @router.get("/command-deck", response_class=HTMLResponse)
 def command_deck(request: Request):
     """
@@ -51,7 +56,7 @@ def command_deck(request: Request):
         "command_deck.html",
         context={
             "weather": weather_data,
-            "build_hash": _get_build_hash(),
-            "build_time": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC"),
+            "build_hash": BUILD_HASH,
+            "build_time": BUILD_TIME,
         }
     )
@@ -63,7 +63,7 @@ _DATABASE_URL: str = os.getenv("DATABASE_URL", "").strip()
 
 # Determine active backend from the URL prefix.
 # If DATABASE_URL is empty or starts with "sqlite", fall back to SQLite.
-if _DATABASE_URL.startswith("postgres://") or _DATABASE_URL.startswith("postgresql://"):
+if _DATABASE_URL.startswith(("postgres://", "postgresql://")):
     DB_BACKEND: str = "postgres"
 else:
     DB_BACKEND = "sqlite"
@@ -6,6 +6,16 @@ from .services_skill_gap import generate_user_skill_gap
 from .services_scoring import score_role_opportunities
 
 
+# recommended_path -> (confidence bonus, reason code); anything else falls
+# through to training_required.
+ROUTE_ADJUSTMENTS = {
+    "direct_match": (25, "high_profile_alignment"),
+    "upskill_then_route": (15, "manageable_skill_gap"),
+    "pivot_role_first": (10, "adjacent_role_path"),
+}
+TRAINING_ROUTE = ("training_required", 0, "low_current_alignment")
+
+
 def generate_market_route(request: UserSkillGapRequest) -> dict:
     role_scores = repo.list_role_scores(request.region_code)
     if not role_scores:
@@ -16,24 +26,15 @@ def generate_market_route(request: UserSkillGapRequest) -> dict:
     best_role = role_scores[0]["role_name"] if role_scores else request.target_role
     second_role = role_scores[1]["role_name"] if len(role_scores) > 1 else None
 
-    reason_codes = []
-    confidence = 50.0
-
-    if gap_report["recommended_path"] == "direct_match":
-        route = "direct_match"
-        confidence += 25
-        reason_codes.append("high_profile_alignment")
-    elif gap_report["recommended_path"] == "upskill_then_route":
-        route = "upskill_then_route"
-        confidence += 15
-        reason_codes.append("manageable_skill_gap")
-    elif gap_report["recommended_path"] == "pivot_role_first":
-        route = "pivot_role_first"
-        confidence += 10
-        reason_codes.append("adjacent_role_path")
+    path = gap_report["recommended_path"]
+    if path in ROUTE_ADJUSTMENTS:
+        bonus, reason = ROUTE_ADJUSTMENTS[path]
+        route = path
     else:
-        route = "training_required"
-        reason_codes.append("low_current_alignment")
+        route, bonus, reason = TRAINING_ROUTE
+
+    reason_codes = [reason]
+    confidence = 50.0 + bonus
 
     if role_scores:
         reason_codes.append("market_demand_signal")
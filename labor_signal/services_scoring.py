@@ -14,6 +14,8 @@ ROLE_BASELINES = {
     "Management Analysts": {"wage": 80, "growth": 78, "employment": 72, "transferability": 84, "friction": 54},
 }
 
+DEFAULT_BASELINE = {"wage": 60, "growth": 55, "employment": 58, "transferability": 62, "friction": 45}
+
 
 def _normalize_demand(metric_value: float) -> float:
     if metric_value <= 0:
@@ -25,16 +27,14 @@ def _normalize_demand(metric_value: float) -> float:
 
 def score_role_opportunities(region_code: str) -> list[dict]:
     records = repo.list_signal_records(region_code=region_code)
-    occupation_rows = [r for r in records if r.get("entity_type") == "occupation"]
 
     scores = []
-    for row in occupation_rows:
+    for row in records:
+        if row.get("entity_type") != "occupation":
+            continue
         role_name = row["entity_name"]
         demand_score = _normalize_demand(float(row.get("metric_value", 0)))
-        baseline = ROLE_BASELINES.get(
-            role_name,
-            {"wage": 60, "growth": 55, "employment": 58, "transferability": 62, "friction": 45},
-        )
+        baseline = ROLE_BASELINES.get(role_name, DEFAULT_BASELINE)
 
         wage_score = baseline["wage"]
         growth_score = baseline["growth"]
@@ -23,17 +23,32 @@ ROLE_REQUIREMENTS = {
     },
 }
 
+DEFAULT_REQUIREMENTS = {"skills": {"communication", "problem solving"}, "certifications": set()}
+
+
+def _normalize_terms(values) -> frozenset:
+    normalized = (value.strip().lower() for value in values)
+    return frozenset(value for value in normalized if value)
+
+
+# role -> (required skills, required certifications), normalized once at import.
+NORMALIZED_REQUIREMENTS = {
+    role: (_normalize_terms(req["skills"]), _normalize_terms(req["certifications"]))
+    for role, req in ROLE_REQUIREMENTS.items()
+}
+DEFAULT_NORMALIZED_REQUIREMENTS = (
+    _normalize_terms(DEFAULT_REQUIREMENTS["skills"]),
+    _normalize_terms(DEFAULT_REQUIREMENTS["certifications"]),
+)
+
 
 def generate_user_skill_gap(request: UserSkillGapRequest) -> dict:
-    req = ROLE_REQUIREMENTS.get(
-        request.target_role,
-        {"skills": {"communication", "problem solving"}, "certifications": set()},
+    required_skills, required_certs = NORMALIZED_REQUIREMENTS.get(
+        request.target_role, DEFAULT_NORMALIZED_REQUIREMENTS
     )
 
-    current_skills = {skill.strip().lower() for skill in request.skills if skill.strip()}
-    current_certs = {cert.strip().lower() for cert in request.certifications if cert.strip()}
-    required_skills = {skill.strip().lower() for skill in req["skills"]}
-    required_certs = {cert.strip().lower() for cert in req["certifications"]}
+    current_skills = _normalize_terms(request.skills)
+    current_certs = _normalize_terms(request.certifications)
 
     missing_skills = sorted(required_skills - current_skills)
     missing_certs = sorted(required_certs - current_certs)
@@ -1,29 +1,44 @@
 from pathlib import Path
 import os
 import json
+import asyncio
+import hashlib
+import logging
 import shutil
 import sqlite3
+import threading
 import time
-import subprocess
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from fastapi import FastAPI, Request, Form, UploadFile, File
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
+from fastapi import FastAPI, Request, Form, UploadFile, File, BackgroundTasks
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+from starlette.concurrency import run_in_threadpool
 from modules.ledger import EventLedger, CareerDNALedger
 from modules.ledger.preview_helper import get_ledger_preview
 from routes.financial_engine_test import financial_engine_router
 from routes.financial_engine_panel import financial_engine_panel_router
 from routes.financial_engine_actions import financial_engine_actions_router
-from command_deck_route import router as command_deck_router
+from command_deck_route import BUILD_HASH, router as command_deck_router
 from command_deck_api import router as command_deck_api_router
 from routes.core_routes import core_routes
 
-from routes.core_routes import core_routes
+logger = logging.getLogger("nautical_compass")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    init_db()
+    yield
+    checkpoint_db()
 
-app = FastAPI(title="Nautical Compass")
+
+app = FastAPI(title="Nautical Compass", lifespan=lifespan)
 app.include_router(core_routes)
 
 app.include_router(financial_engine_router)
@@ -36,10 +51,61 @@ app.include_router(command_deck_api_router)
 UPLOAD_ROOT = Path("uploads")
 UPLOAD_ROOT.mkdir(parents=True, exist_ok=True)
 
-app.mount("/static", StaticFiles(directory="static"), name="static")
-app.mount("/uploads", StaticFiles(directory=str(UPLOAD_ROOT)), name="uploads")
+STATIC_DIR = Path("static")
+
+
+def str_to_bool(value: str | None, default: bool = False) -> bool:
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+# Behind the Nginx front in deploy/nginx.conf these are served from disk instead.
+SERVE_STATIC = str_to_bool(os.getenv("SERVE_STATIC"), True)
+
+
+class CachedStaticFiles(StaticFiles):
+    # Asset links carry ?v=ASSET_VERSION, so a versioned URL never changes
+    # content and can be cached for good; bare URLs get a short lifetime.
+    async def get_response(self, path: str, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            if any(part.startswith(b"v=") for part in scope.get("query_string", b"").split(b"&")):
+                response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+            else:
+                response.headers["Cache-Control"] = "public, max-age=3600"
+        return response
+
+
+if SERVE_STATIC:
+    app.mount("/static", CachedStaticFiles(directory=str(STATIC_DIR)), name="static")
+    app.mount("/uploads", StaticFiles(directory=str(UPLOAD_ROOT)), name="uploads")
+
+# Nginx compresses proxied responses itself; skip the middleware there.
+GZIP_RESPONSES = str_to_bool(os.getenv("GZIP_RESPONSES"), True)
+
+if GZIP_RESPONSES:
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 templates = Jinja2Templates(directory="templates")
+# Templates only change on deploy: keep compiled bytecode across restarts and
+# skip the per-render mtime check.
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+templates.env.auto_reload = False
+
+for hot_template in ("base.html", "index.html", "services.html", "case_dock.html"):
+    templates.env.get_template(hot_template)
+
+# Fixed per process so asset URLs and page bodies stay stable between deploys.
+ASSET_VERSION = int(time.time())
+STATIC_PAGE_CACHE_CONTROL = "public, max-age=300"
+
+FAVICON_PATH = STATIC_DIR / "favicon.ico"
+FAVICON_BYTES = FAVICON_PATH.read_bytes() if FAVICON_PATH.exists() else None
+# ETags here are weak: GZipMiddleware (or Nginx) may re-encode the body, and a
+# strong validator would have to differ per content-coding.
+FAVICON_ETAG = f'W/"{hashlib.md5(FAVICON_BYTES).hexdigest()}"' if FAVICON_BYTES is not None else None
+FAVICON_HEADERS = {"ETag": FAVICON_ETAG or "", "Cache-Control": "public, max-age=86400"}
 
 DB_PATH = Path("nautical_compass.db")
 
@@ -63,11 +129,41 @@ LABOR_SUBMISSIONS = []
 EMPLOYER_REQUESTS = []
 PARTNER_SUBMISSIONS = []
 
+# Normalized email / phone -> position of the first LABOR_SUBMISSIONS row carrying it.
+LABOR_EMAIL_INDEX: dict[str, int] = {}
+LABOR_PHONE_INDEX: dict[str, int] = {}
 
-def str_to_bool(value: str | None, default: bool = False) -> bool:
-    if value is None:
-        return default
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+def index_labor_submission(position: int, record: dict) -> None:
+    email_key = (record.get("email") or "").strip().lower()
+    phone_key = (record.get("phone") or "").strip()
+
+    if email_key:
+        LABOR_EMAIL_INDEX.setdefault(email_key, position)
+    if phone_key:
+        LABOR_PHONE_INDEX.setdefault(phone_key, position)
+
+
+def rebuild_labor_index() -> None:
+    LABOR_EMAIL_INDEX.clear()
+    LABOR_PHONE_INDEX.clear()
+    for position, record in enumerate(LABOR_SUBMISSIONS):
+        index_labor_submission(position, record)
+
+
+def find_labor_worker_id(email: str | None, phone: str | None) -> str | None:
+    normalized_email = (email or "").strip().lower()
+    normalized_phone = (phone or "").strip()
+
+    positions = []
+    if normalized_email and normalized_email in LABOR_EMAIL_INDEX:
+        positions.append(LABOR_EMAIL_INDEX[normalized_email])
+    if normalized_phone and normalized_phone in LABOR_PHONE_INDEX:
+        positions.append(LABOR_PHONE_INDEX[normalized_phone])
+
+    if not positions:
+        return None
+    return LABOR_SUBMISSIONS[min(positions)].get("nc_worker_id")
 
 
 def labor_signal_flags() -> dict:
@@ -82,14 +178,62 @@ def labor_signal_flags() -> dict:
     }
 
 
+# Feature flags are read from the environment once per process; every page
+# render shares this dict, so treat it as read-only.
+LABOR_SIGNAL_FLAGS = labor_signal_flags()
+
+
+_db_local = threading.local()
+
+
 def db_conn():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    # One long-lived autocommit connection per worker thread. Reads run on it
+    # directly; writes go through db_write() for an explicit transaction.
+    conn = getattr(_db_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH, timeout=5.0, cached_statements=256, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=134217728")
+        _db_local.conn = conn
     return conn
 
 
+@contextmanager
+def db_write():
+    # Connections run in autocommit mode, so this is the only place a write
+    # transaction opens. Taking the write lock up front means it never has to
+    # upgrade from a shared lock mid-flight and hit SQLITE_BUSY.
+    # The connection outlives the request, so it must never be left inside an
+    # open transaction: roll back on any exit that doesn't commit cleanly.
+    conn = db_conn()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+        conn.execute("COMMIT")
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+
+
+# Bump when init_db() gains a migration step.
+SCHEMA_VERSION = 1
+
+
 def init_db():
-    with db_conn() as conn:
+    conn = db_conn()
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
+
+    with db_write() as conn:
+        # Re-check under the write lock; another worker may have just migrated.
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS cases (
@@ -111,26 +255,47 @@ def init_db():
             )
             """
         )
-        conn.commit()
 
         columns = [row["name"] for row in conn.execute("PRAGMA table_info(cases)").fetchall()]
         if "compliance_json" not in columns:
             conn.execute("ALTER TABLE cases ADD COLUMN compliance_json TEXT")
-            conn.commit()
 
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
-init_db()
+
+def checkpoint_db():
+    # Fold the WAL back into the main file so the next start reads one file.
+    db_conn().execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
 
 def render(request: Request, template: str, data=None):
     ctx = data or {}
     ctx["request"] = request
-    ctx["v"] = int(time.time())
-    ctx["labor_signal_flags"] = labor_signal_flags()
-    ctx["labor_signal_enabled"] = labor_signal_flags()["ENABLE_LABOR_SIGNAL_ENGINE"]
+    ctx["v"] = ASSET_VERSION
+    ctx["labor_signal_flags"] = LABOR_SIGNAL_FLAGS
+    ctx["labor_signal_enabled"] = LABOR_SIGNAL_FLAGS["ENABLE_LABOR_SIGNAL_ENGINE"]
     return templates.TemplateResponse(request, template, context=ctx)
 
 
+# template name -> (rendered body, ETag); these pages take no per-request data.
+STATIC_PAGE_CACHE: dict[str, tuple[bytes, str]] = {}
+
+
+def render_static_page(request: Request, template: str, data=None):
+    # `data` must be the same on every call; only the first render sees it.
+    cached = STATIC_PAGE_CACHE.get(template)
+    if cached is None:
+        body = render(request, template, data).body
+        cached = (body, f'W/"{hashlib.md5(body).hexdigest()}"')
+        STATIC_PAGE_CACHE[template] = cached
+
+    body, etag = cached
+    headers = {"ETag": etag, "Cache-Control": STATIC_PAGE_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(body, headers=headers)
+
+
 
 
 def get_checkout_links():
@@ -160,14 +325,31 @@ def get_checkout_links():
         "labor_signal_basic": labor_signal_basic,
         "labor_signal_pro": labor_signal_pro,
     }
+
+
+# Payment links only change with the environment, i.e. on redeploy.
+CHECKOUT_LINKS = get_checkout_links()
+
+missing_checkout_links = [name for name, link in CHECKOUT_LINKS.items() if not link]
+if missing_checkout_links:
+    logger.warning("Checkout links not configured: %s", ", ".join(missing_checkout_links))
+
+CHECKOUT_PLAN_TITLES = {
+    "access": "NC Access — $25/month",
+    "protection": "NC Protection — $75/month",
+    "command": "NC Command — $135/month",
+}
+
+
 def save_uploads(files: list[UploadFile], target_dir: Path) -> list[dict]:
     saved_files = []
+    stamp = int(time.time())
 
     for file in files:
         if not file or not file.filename:
             continue
 
-        safe_name = f"{int(time.time())}_{uuid4().hex}_{file.filename}"
+        safe_name = f"{stamp}_{uuid4().hex}_{file.filename}"
         out_path = target_dir / safe_name
 
         with out_path.open("wb") as buffer:
@@ -183,16 +365,19 @@ def save_uploads(files: list[UploadFile], target_dir: Path) -> list[dict]:
     return saved_files
 
 
+# Issue-type keywords checked by infer_case_route, in priority order.
+AUTO_FINANCE_ISSUE_TERMS = ("auto finance", "car note", "vehicle finance", "repossession", "auto loan")
+FCRA_ISSUE_TERMS = ("fcra", "credit reporting", "consumer reporting", "credit report")
+EMPLOYMENT_ISSUE_TERMS = ("employment", "workplace discrimination", "retaliation", "wrongful termination", "eeoc")
+HOUSING_ISSUE_TERMS = ("housing", "tenant", "eviction", "lease dispute", "rent")
+CONTRACT_ISSUE_TERMS = ("contract", "breach", "nonpayment", "invoice dispute")
+AUTO_FINANCE_FACT_TERMS = ("buick", "car note", "repossession", "vehicle", "auto loan", "lender")
+
+
 def infer_case_route(case_data: dict) -> dict:
     issue = (case_data.get("issue_type") or "").strip().lower()
-    title = (case_data.get("matter_title") or "").strip().lower()
-    summary = (case_data.get("summary") or "").strip().lower()
-    timeline = (case_data.get("timeline") or "").strip().lower()
-    parties = (case_data.get("parties") or "").strip().lower()
 
-    combined = " ".join([title, summary, timeline, parties])
-
-    if any(term in issue for term in ["auto finance", "car note", "vehicle finance", "repossession", "auto loan"]):
+    if any(term in issue for term in AUTO_FINANCE_ISSUE_TERMS):
         return {
             "route_name": "Auto Finance / Repossession Route",
             "rationale": [
@@ -212,7 +397,7 @@ def infer_case_route(case_data: dict) -> dict:
             ],
         }
 
-    if any(term in issue for term in ["fcra", "credit reporting", "consumer reporting", "credit report"]):
+    if any(term in issue for term in FCRA_ISSUE_TERMS):
         return {
             "route_name": "FCRA / Consumer Reporting Route",
             "rationale": [
@@ -232,7 +417,7 @@ def infer_case_route(case_data: dict) -> dict:
             ],
         }
 
-    if any(term in issue for term in ["employment", "workplace discrimination", "retaliation", "wrongful termination", "eeoc"]):
+    if any(term in issue for term in EMPLOYMENT_ISSUE_TERMS):
         return {
             "route_name": "Employment / EEOC Route",
             "rationale": [
@@ -252,7 +437,7 @@ def infer_case_route(case_data: dict) -> dict:
             ],
         }
 
-    if any(term in issue for term in ["housing", "tenant", "eviction", "lease dispute", "rent"]):
+    if any(term in issue for term in HOUSING_ISSUE_TERMS):
         return {
             "route_name": "Housing / Tenant Defense Route",
             "rationale": [
@@ -272,7 +457,7 @@ def infer_case_route(case_data: dict) -> dict:
             ],
         }
 
-    if any(term in issue for term in ["contract", "breach", "nonpayment", "invoice dispute"]):
+    if any(term in issue for term in CONTRACT_ISSUE_TERMS):
         return {
             "route_name": "Contract / Payment Enforcement Route",
             "rationale": [
@@ -293,7 +478,13 @@ def infer_case_route(case_data: dict) -> dict:
         }
 
     if issue == "":
-        if any(term in combined for term in ["buick", "car note", "repossession", "vehicle", "auto loan", "lender"]):
+        # Only fall back to the free-text facts (summary can be long) when no
+        # issue type was given.
+        combined = " ".join(
+            (case_data.get(field) or "").strip().lower()
+            for field in ("matter_title", "summary", "timeline", "parties")
+        )
+        if any(term in combined for term in AUTO_FINANCE_FACT_TERMS):
             return {
                 "route_name": "Auto Finance / Repossession Route",
                 "rationale": [
@@ -361,6 +552,21 @@ def validate_actor(request: Request) -> dict:
     }
 
 
+HIGH_RISK_ROUTES = frozenset(
+    {
+        "Auto Finance / Repossession Route",
+        "Employment / EEOC Route",
+        "Housing / Tenant Defense Route",
+    }
+)
+RIGHTS_ROUTES = frozenset(
+    {
+        "FCRA / Consumer Reporting Route",
+        "Employment / EEOC Route",
+    }
+)
+
+
 def classify_request(case_data: dict, route_data: dict) -> dict:
     route_name = route_data.get("route_name", "General Civil / Administrative Review")
     issue_type = (case_data.get("issue_type") or "").strip().lower()
@@ -372,21 +578,10 @@ def classify_request(case_data: dict, route_data: dict) -> dict:
     requires_human_review = False
     blocking_flags = []
 
-    high_risk_routes = {
-        "Auto Finance / Repossession Route",
-        "Employment / EEOC Route",
-        "Housing / Tenant Defense Route",
-    }
-
-    rights_routes = {
-        "FCRA / Consumer Reporting Route",
-        "Employment / EEOC Route",
-    }
-
-    if route_name in rights_routes:
+    if route_name in RIGHTS_ROUTES:
         action_type = "rights_analysis"
 
-    if route_name in high_risk_routes:
+    if route_name in HIGH_RISK_ROUTES:
         risk_level = "high"
         requires_human_review = True
 
@@ -461,7 +656,7 @@ def attach_legal_basis(case_data: dict, route_data: dict) -> list[dict]:
     return legal_basis
 
 
-def build_compliance_gate(request: Request, case_data: dict, route_data: dict) -> dict:
+def build_compliance_gate(request: Request, case_data: dict, route_data: dict, audit_stamp: int | None = None) -> dict:
     actor = validate_actor(request)
     request_profile = classify_request(case_data, route_data)
     legal_basis = attach_legal_basis(case_data, route_data)
@@ -472,7 +667,7 @@ def build_compliance_gate(request: Request, case_data: dict, route_data: dict) -
         "request_profile": request_profile,
         "legal_basis": legal_basis,
         "human_review_status": "required" if request_profile["requires_human_review"] else "not_required",
-        "audit_stamp": int(time.time()),
+        "audit_stamp": audit_stamp if audit_stamp is not None else int(time.time()),
     }
 
 
@@ -663,29 +858,62 @@ BLOCKING FLAGS
     return case_folder_name, generated_docs
 
 
+# Kept as module constants so every call hands sqlite3 the identical string
+# and hits the per-connection statement cache.
+CASE_INSERT_SQL = """
+    INSERT INTO cases (
+        id,
+        matter_title,
+        jurisdiction,
+        issue_type,
+        parties,
+        timeline,
+        summary,
+        requested_outcome,
+        created_at,
+        case_folder_name,
+        route_name,
+        route_json,
+        files_json,
+        generated_docs_json,
+        compliance_json
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+CASE_UPDATE_SQL = """
+    UPDATE cases
+    SET timeline = ?,
+        summary = ?,
+        requested_outcome = ?,
+        case_folder_name = ?,
+        route_name = ?,
+        route_json = ?,
+        files_json = ?,
+        generated_docs_json = ?,
+        compliance_json = ?
+    WHERE id = ?
+"""
+
+LATEST_CASE_SQL = """
+    SELECT id, matter_title, jurisdiction, issue_type, parties, timeline, summary,
+           requested_outcome, created_at, case_folder_name, route_json, files_json,
+           generated_docs_json, compliance_json
+    FROM cases
+    ORDER BY id DESC
+    LIMIT 1
+"""
+NEXT_CASE_ID_SQL = "SELECT COALESCE(MAX(id), 0) + 1 FROM cases"
+
+
+def next_case_id() -> int:
+    return db_conn().execute(NEXT_CASE_ID_SQL).fetchone()[0]
+
+
 def store_case_record(case_data: dict):
-    with db_conn() as conn:
+    with db_write() as conn:
         conn.execute(
-            """
-            INSERT INTO cases (
-                id,
-                matter_title,
-                jurisdiction,
-                issue_type,
-                parties,
-                timeline,
-                summary,
-                requested_outcome,
-                created_at,
-                case_folder_name,
-                route_name,
-                route_json,
-                files_json,
-                generated_docs_json,
-                compliance_json
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            CASE_INSERT_SQL,
             (
                 case_data["id"],
                 case_data["matter_title"],
@@ -704,25 +932,13 @@ def store_case_record(case_data: dict):
                 json.dumps(case_data.get("compliance_gate", {})),
             ),
         )
-        conn.commit()
+    invalidate_latest_case()
 
 
 def update_case_record(case_data: dict):
-    with db_conn() as conn:
+    with db_write() as conn:
         conn.execute(
-            """
-            UPDATE cases
-            SET timeline = ?,
-                summary = ?,
-                requested_outcome = ?,
-                case_folder_name = ?,
-                route_name = ?,
-                route_json = ?,
-                files_json = ?,
-                generated_docs_json = ?,
-                compliance_json = ?
-            WHERE id = ?
-            """,
+            CASE_UPDATE_SQL,
             (
                 case_data["timeline"],
                 case_data["summary"],
@@ -736,7 +952,24 @@ def update_case_record(case_data: dict):
                 case_data["id"],
             ),
         )
-        conn.commit()
+    invalidate_latest_case()
+
+
+# (review field, heading) in the order each section is appended to the summary.
+SIGNAL_REVIEW_SECTIONS = (
+    ("critical_deadlines", "CRITICAL DEADLINES"),
+    ("notice_signals", "NOTICE SIGNALS"),
+    ("risk_flags", "RISK FLAGS"),
+    ("signal_summary", "SIGNAL SUMMARY"),
+)
+
+EQUITY_REVIEW_SECTIONS = (
+    ("relief_sought", "RELIEF SOUGHT"),
+    ("equitable_posture", "EQUITABLE POSTURE"),
+    ("pressure_path", "PRESSURE PATH"),
+    ("urgency_level", "URGENCY LEVEL"),
+    ("equity_notes", "EQUITY NOTES"),
+)
 
 
 def merge_route_module_state(existing_module_state: dict, updates: dict) -> dict:
@@ -749,18 +982,58 @@ def merge_route_module_state(existing_module_state: dict, updates: dict) -> dict
     return merged
 
 
+# Every case-module page reads the latest case; keep it briefly in process and
+# drop it whenever this process writes a case row.
+LATEST_CASE_TTL_SECONDS = 5.0
+LATEST_CASE_CACHE = {"value": None, "expires_at": 0.0, "generation": 0}
+LATEST_CASE_LOCK = threading.Lock()
+
+
+# The case handlers await threadpool hops between reading case rows and writing
+# them back (MAX(id)+1 -> INSERT, latest case -> UPDATE). Holding this across
+# that window keeps concurrent submissions in one process from claiming the
+# same id or overwriting each other's updates.
+CASE_WRITE_LOCK = asyncio.Lock()
+
+
+def invalidate_latest_case():
+    with LATEST_CASE_LOCK:
+        LATEST_CASE_CACHE["expires_at"] = 0.0
+        LATEST_CASE_CACHE["generation"] += 1
+
+
 def fetch_latest_case():
-    with db_conn() as conn:
-        row = conn.execute("SELECT * FROM cases ORDER BY id DESC LIMIT 1").fetchone()
+    # The returned dict is shared between requests; callers must not mutate it.
+    with LATEST_CASE_LOCK:
+        if time.monotonic() < LATEST_CASE_CACHE["expires_at"]:
+            return LATEST_CASE_CACHE["value"]
+        generation = LATEST_CASE_CACHE["generation"]
+
+    case = load_latest_case()
+
+    with LATEST_CASE_LOCK:
+        if LATEST_CASE_CACHE["generation"] == generation:
+            LATEST_CASE_CACHE["value"] = case
+            LATEST_CASE_CACHE["expires_at"] = time.monotonic() + LATEST_CASE_TTL_SECONDS
+    return case
+
+
+def load_latest_case():
+    row = db_conn().execute(LATEST_CASE_SQL).fetchone()
 
     if not row:
         return None
 
-    compliance = {}
-    if "compliance_json" in row.keys() and row["compliance_json"]:
-        compliance = json.loads(row["compliance_json"])
+    (
+        case_id, matter_title, jurisdiction, issue_type, parties, timeline, summary,
+        requested_outcome, created_at, case_folder_name, route_json, files_json,
+        generated_docs_json, compliance_json,
+    ) = row
+
+    compliance = json.loads(compliance_json) if compliance_json else {}
+    files = json.loads(files_json) if files_json else []
 
-    route = json.loads(row["route_json"]) if row["route_json"] else {}
+    route = json.loads(route_json) if route_json else {}
     if compliance and "compliance_gate" not in route:
         route["compliance_gate"] = compliance
 
@@ -769,16 +1042,16 @@ def fetch_latest_case():
         "case_dock",
         {
             "status": "complete",
-            "completed_at": row["created_at"],
+            "completed_at": created_at,
             "snapshot": {
-                "matter_title": row["matter_title"],
-                "jurisdiction": row["jurisdiction"],
-                "issue_type": row["issue_type"],
-                "requested_outcome": row["requested_outcome"],
-                "parties": row["parties"],
-                "timeline": row["timeline"],
-                "summary": row["summary"],
-                "file_count": len(json.loads(row["files_json"])) if row["files_json"] else 0,
+                "matter_title": matter_title,
+                "jurisdiction": jurisdiction,
+                "issue_type": issue_type,
+                "requested_outcome": requested_outcome,
+                "parties": parties,
+                "timeline": timeline,
+                "summary": summary,
+                "file_count": len(files),
             },
         },
     )
@@ -790,27 +1063,144 @@ def fetch_latest_case():
     )
 
     return {
-        "id": row["id"],
-        "matter_title": row["matter_title"],
-        "jurisdiction": row["jurisdiction"],
-        "issue_type": row["issue_type"],
-        "parties": row["parties"],
-        "timeline": row["timeline"],
-        "summary": row["summary"],
-        "requested_outcome": row["requested_outcome"],
-        "created_at": row["created_at"],
-        "case_folder_name": row["case_folder_name"],
+        "id": case_id,
+        "matter_title": matter_title,
+        "jurisdiction": jurisdiction,
+        "issue_type": issue_type,
+        "parties": parties,
+        "timeline": timeline,
+        "summary": summary,
+        "requested_outcome": requested_outcome,
+        "created_at": created_at,
+        "case_folder_name": case_folder_name,
         "route": route,
-        "files": json.loads(row["files_json"]) if row["files_json"] else [],
-        "generated_docs": json.loads(row["generated_docs_json"]) if row["generated_docs_json"] else [],
+        "files": files,
+        "generated_docs": json.loads(generated_docs_json) if generated_docs_json else [],
         "further_action_required": True,
         "compliance_gate": compliance or route.get("compliance_gate", {}),
     }
 
 
+DISPATCH_UNAVAILABLE_TERMS = (
+    "unavailable", "not available", "booked", "busy", "full", "cannot", "can't",
+    "off", "no availability", "not free",
+)
+DISPATCH_LIMITED_TERMS = (
+    "limited", "part-time", "part time", "weekend", "weekends", "evening",
+    "evenings", "after", "partial", "some days", "select days", "certain days",
+)
+DISPATCH_READY_TERMS = (
+    "ready", "available", "open", "flexible", "full-time", "full time",
+    "anytime", "open availability", "immediate",
+)
+
+SKILL_FLAG_CHECKS = (
+    ("OSHA", ("osha",)),
+    ("Forklift", ("forklift",)),
+    ("Rigging", ("rigging", "rigger")),
+    ("Lift Cert", ("scissor", "boom lift", "lift cert")),
+    ("ETCP", ("etcp",)),
+    ("CDL", ("cdl",)),
+    ("Audio", ("audio", "a1", "a2")),
+    ("Video", ("video", "v1", "v2")),
+    ("Lighting", ("lighting", "lx", "l1", "l2")),
+    ("Stagehand", ("stagehand",)),
+)
+
+# dispatch readiness -> (score points, match label, next move)
+READINESS_MATCH_TABLE = {
+    "ready": (25, "Ready Now", "Open Worker Dashboard"),
+    "limited": (10, "Limited Availability", "Clarify availability for dispatch"),
+    "unavailable": (0, "Currently Unavailable", "Update availability before dispatch"),
+}
+READINESS_MATCH_UNKNOWN = (0, "Availability Needs Clarification", "Add clearer availability")
+
+
+def normalize_dispatch_readiness(value: str | None) -> str:
+    raw = (value or "").strip().lower()
+
+    if not raw:
+        return "unknown"
+    if any(term in raw for term in DISPATCH_UNAVAILABLE_TERMS):
+        return "unavailable"
+    if any(term in raw for term in DISPATCH_LIMITED_TERMS):
+        return "limited"
+    if any(term in raw for term in DISPATCH_READY_TERMS):
+        return "ready"
+    return "limited"
+
+
+def parse_certification_tags(value: str | None) -> list[str]:
+    raw = (value or "").strip()
+    if not raw:
+        return []
+
+    normalized = raw.replace(";", ",").replace("|", ",")
+    tags = []
+
+    for part in normalized.split(","):
+        item = part.strip()
+        if item and item not in tags:
+            tags.append(item)
+
+    return tags[:12]
+
+
+def detect_common_skill_flags(tags: list[str]) -> list[str]:
+    joined = " | ".join(tags).lower()
+    return [
+        label
+        for label, needles in SKILL_FLAG_CHECKS
+        if any(needle in joined for needle in needles)
+    ]
+
+
+def build_match_result(primary_role: str | None, market_area: str | None, availability: str | None, certification_tags: list[str], skill_flags: list[str]) -> dict:
+    role = (primary_role or "").strip()
+    market = (market_area or "").strip()
+    readiness_points, readiness_label, next_move = READINESS_MATCH_TABLE.get(
+        normalize_dispatch_readiness(availability), READINESS_MATCH_UNKNOWN
+    )
+
+    score = (40 if role else 0) + (20 if market else 0) + readiness_points
+    labels = [readiness_label]
+
+    if certification_tags or skill_flags:
+        score += 15
+        labels.append("Strong Match")
+    else:
+        labels.append("Certification Opportunity")
+        if next_move == "Open Worker Dashboard":
+            next_move = "Add certifications to strengthen dispatch trust"
+
+    if not market:
+        labels.append("Market Alignment Needed")
+        next_move = "Add market area for stronger matching"
+
+    return {
+        "match_score": max(0, min(score, 100)),
+        "match_labels": labels,
+        "next_move": next_move,
+    }
+
+
 @app.get("/", response_class=HTMLResponse)
 def home(request: Request):
-    return render(request, "index.html")
+    return render_static_page(request, "index.html")
+
+
+@app.get("/favicon.ico", include_in_schema=False)
+def favicon(request: Request):
+    if FAVICON_BYTES is None:
+        return Response(status_code=404)
+
+    if request.headers.get("if-none-match") == FAVICON_ETAG:
+        return Response(status_code=304, headers=FAVICON_HEADERS)
+    return Response(FAVICON_BYTES, media_type="image/x-icon", headers=FAVICON_HEADERS)
+
+
+# Fixed for the life of the process; /health used to fork git on every probe.
+BUILD_TIME = datetime.now(timezone.utc).isoformat()
 
 
 @app.get("/health")
@@ -824,39 +1214,33 @@ def health():
     except Exception as exc:
         module_error = str(exc)
 
-    try:
-        _commit = subprocess.check_output(
-            ["git", "rev-parse", "--short", "HEAD"],
-            text=True, timeout=3
-        ).strip()
-    except Exception:
-        _commit = "unknown"
     return JSONResponse(
         {
             "ok": True,
             "app": "Nautical Compass",
-            "commit": _commit,
-            "build_time": datetime.now(timezone.utc).isoformat(),
+            "commit": BUILD_HASH,
+            "build_time": BUILD_TIME,
             "starlette_compat": "1.0+",
             "labor_signal_module_imported": module_imported,
             "labor_signal_module_error": module_error,
-            "labor_signal_flags": labor_signal_flags(),
+            "labor_signal_flags": LABOR_SIGNAL_FLAGS,
         }
     )
 
 
 @app.get("/hall", response_class=HTMLResponse)
 def hall(request: Request):
-    return render(request, "hall.html")
+    return render_static_page(request, "hall.html")
 
 
+@app.get("/dashboards", response_class=HTMLResponse)
 def dashboards(request: Request):
-    return render(request, "dashboards_hub.html")
+    return render_static_page(request, "dashboards_hub.html")
 
 
 @app.get("/lead", response_class=HTMLResponse)
 def lead(request: Request):
-    return render(request, "lead_intake.html")
+    return render_static_page(request, "lead_intake.html")
 
 
 @app.post("/lead")
@@ -870,18 +1254,19 @@ def lead_submit(
 
 @app.get("/lead/thanks", response_class=HTMLResponse)
 def lead_thanks(request: Request):
-    return render(request, "lead_thanks.html")
+    return render_static_page(request, "lead_thanks.html")
 
 
 @app.get("/sponsor", response_class=HTMLResponse)
 def sponsor(request: Request):
-    return render(request, "sponsor.html")
+    return render_static_page(request, "sponsor.html")
 
 
 @app.get("/checkout", response_class=HTMLResponse)
-def checkout(request: Request):
+def checkout(request: Request, background_tasks: BackgroundTasks):
 
-    EventLedger().record(
+    background_tasks.add_task(
+        EventLedger().record,
         event_type="checkout_opened",
         module="access",
         status="started",
@@ -890,33 +1275,15 @@ def checkout(request: Request):
         route="/checkout",
         payload={"source": "route_open"},
     )
-    return render(request, "checkout.html", get_checkout_links())
-
-    links = get_checkout_links()
-    return render(
-        request,
-        "checkout.html",
-        {
-            "nc_access_link": links.get("nc_access_link", ""),
-            "nc_protection_link": links.get("nc_protection_link", ""),
-            "nc_command_link": links.get("nc_command_link", ""),
-        },
-    )
-
+    return render(request, "checkout.html", dict(CHECKOUT_LINKS))
 
 
 @app.get("/checkout/{plan_key}", response_class=HTMLResponse)
-def checkout_plan(request: Request, plan_key: str):
-    links = get_checkout_links()
-    checkout_url = links.get(plan_key, "")
-
-    plan_titles = {
-        "access": "NC Access — $25/month",
-        "protection": "NC Protection — $75/month",
-        "command": "NC Command — $135/month",
-    }
+def checkout_plan(request: Request, plan_key: str, background_tasks: BackgroundTasks):
+    checkout_url = CHECKOUT_LINKS.get(plan_key, "")
 
-    EventLedger().record(
+    background_tasks.add_task(
+        EventLedger().record,
         event_type="checkout_plan_selected",
         module="access",
         status="redirect_ready" if checkout_url else "missing_link",
@@ -925,7 +1292,7 @@ def checkout_plan(request: Request, plan_key: str):
         route=f"/checkout/{plan_key}",
         payload={
             "plan_key": plan_key,
-            "plan_title": plan_titles.get(plan_key, "Selected Plan"),
+            "plan_title": CHECKOUT_PLAN_TITLES.get(plan_key, "Selected Plan"),
             "has_checkout_url": bool(checkout_url),
         },
     )
@@ -938,14 +1305,14 @@ def checkout_plan(request: Request, plan_key: str):
         "subscription_setup_needed.html",
         {
             "plan_key": plan_key,
-            "plan_title": plan_titles.get(plan_key, "Selected Plan"),
+            "plan_title": CHECKOUT_PLAN_TITLES.get(plan_key, "Selected Plan"),
         },
     )
 
 
 @app.get("/partner", response_class=HTMLResponse)
 def partner(request: Request):
-    return render(request, "partner_intake.html")
+    return render_static_page(request, "partner_intake.html")
 
 
 @app.post("/partner")
@@ -961,7 +1328,7 @@ async def partner_submit(
     notes: str = Form(""),
     files: list[UploadFile] = File(default=[]),
 ):
-    saved_files = save_uploads(files, PARTNER_UPLOADS)
+    saved_files = await run_in_threadpool(save_uploads, files, PARTNER_UPLOADS)
     submission_id = len(PARTNER_SUBMISSIONS) + 1
 
     PARTNER_SUBMISSIONS.append(
@@ -1002,7 +1369,7 @@ async def partner_submit(
 
 @app.get("/intake/production", response_class=HTMLResponse)
 def intake_production(request: Request):
-    return render(request, "intake_production.html")
+    return render_static_page(request, "intake_production.html")
 
 
 @app.post("/intake/production")
@@ -1020,7 +1387,7 @@ async def intake_production_submit(
     logistics_notes: str = Form(""),
     files: list[UploadFile] = File(default=[]),
 ):
-    saved_files = save_uploads(files, PRODUCTION_UPLOADS)
+    saved_files = await run_in_threadpool(save_uploads, files, PRODUCTION_UPLOADS)
     submission_id = len(PRODUCTION_SUBMISSIONS) + 1
 
     PRODUCTION_SUBMISSIONS.append(
@@ -1064,12 +1431,13 @@ async def intake_production_submit(
 
 @app.get("/labor/employer-request/start", response_class=HTMLResponse)
 def employer_request_start(request: Request):
-    return render(request, "employer_request_start.html")
+    return render_static_page(request, "employer_request_start.html")
 
 
 @app.post("/labor/employer-request/start", response_class=HTMLResponse)
 async def employer_request_start_submit(
     request: Request,
+    background_tasks: BackgroundTasks,
     requested_roles_headcount: str = Form(""),
     event_date: str = Form(""),
     shift_window: str = Form(""),
@@ -1090,7 +1458,8 @@ async def employer_request_start_submit(
         }
     )
 
-    EventLedger().record(
+    background_tasks.add_task(
+        EventLedger().record,
         event_type="employer_request_started",
         module="employer_request",
         status="submitted",
@@ -1125,126 +1494,6 @@ async def employer_request_start_submit(
 
 @app.get("/labor/employer-view", response_class=HTMLResponse)
 def labor_employer_view(request: Request):
-    def normalize_dispatch_readiness(value: str | None) -> str:
-        raw = (value or "").strip().lower()
-
-        if not raw:
-            return "unknown"
-
-        unavailable_terms = [
-            "unavailable", "not available", "booked", "busy", "full", "cannot", "can't",
-            "off", "no availability", "not free"
-        ]
-        limited_terms = [
-            "limited", "part-time", "part time", "weekend", "weekends", "evening",
-            "evenings", "after", "partial", "some days", "select days", "certain days"
-        ]
-        ready_terms = [
-            "ready", "available", "open", "flexible", "full-time", "full time",
-            "anytime", "open availability", "immediate"
-        ]
-
-        for term in unavailable_terms:
-            if term in raw:
-                return "unavailable"
-
-        for term in limited_terms:
-            if term in raw:
-                return "limited"
-
-        for term in ready_terms:
-            if term in raw:
-                return "ready"
-
-        return "limited"
-
-    def parse_certification_tags(value: str | None) -> list[str]:
-        raw = (value or "").strip()
-        if not raw:
-            return []
-
-        normalized = raw.replace(";", ",").replace("|", ",")
-        tags = []
-
-        for part in normalized.split(","):
-            item = part.strip()
-            if item and item not in tags:
-                tags.append(item)
-
-        return tags[:12]
-
-    def detect_common_skill_flags(tags: list[str]) -> list[str]:
-        joined = " | ".join(tags).lower()
-        flags = []
-
-        checks = [
-            ("OSHA", ["osha"]),
-            ("Forklift", ["forklift"]),
-            ("Rigging", ["rigging", "rigger"]),
-            ("Lift Cert", ["scissor", "boom lift", "lift cert"]),
-            ("ETCP", ["etcp"]),
-            ("CDL", ["cdl"]),
-            ("Audio", ["audio", "a1", "a2"]),
-            ("Video", ["video", "v1", "v2"]),
-            ("Lighting", ["lighting", "lx", "l1", "l2"]),
-            ("Stagehand", ["stagehand"]),
-        ]
-
-        for label, needles in checks:
-            if any(needle in joined for needle in needles):
-                flags.append(label)
-
-        return flags
-
-    def build_match_result(primary_role: str | None, market_area: str | None, availability: str | None, certification_tags: list[str], skill_flags: list[str]) -> dict:
-        role = (primary_role or "").strip()
-        market = (market_area or "").strip()
-        readiness = normalize_dispatch_readiness(availability)
-
-        score = 0
-        labels = []
-        next_move = "Complete worker profile"
-
-        if role:
-            score += 40
-        if market:
-            score += 20
-
-        if readiness == "ready":
-            score += 25
-            labels.append("Ready Now")
-            next_move = "Open Worker Dashboard"
-        elif readiness == "limited":
-            score += 10
-            labels.append("Limited Availability")
-            next_move = "Clarify availability for dispatch"
-        elif readiness == "unavailable":
-            labels.append("Currently Unavailable")
-            next_move = "Update availability before dispatch"
-        else:
-            labels.append("Availability Needs Clarification")
-            next_move = "Add clearer availability"
-
-        if certification_tags or skill_flags:
-            score += 15
-            labels.append("Strong Match")
-        else:
-            labels.append("Certification Opportunity")
-            if next_move == "Open Worker Dashboard":
-                next_move = "Add certifications to strengthen dispatch trust"
-
-        if not market:
-            labels.append("Market Alignment Needed")
-            next_move = "Add market area for stronger matching"
-
-        score = max(0, min(score, 100))
-
-        return {
-            "match_score": score,
-            "match_labels": labels,
-            "next_move": next_move,
-        }
-
     latest = None
     for existing in reversed(LABOR_SUBMISSIONS):
         if existing.get("nc_worker_id"):
@@ -1300,126 +1549,6 @@ def labor_employer_view(request: Request):
 
 @app.get("/labor/match-review", response_class=HTMLResponse)
 def labor_match_review(request: Request):
-    def normalize_dispatch_readiness(value: str | None) -> str:
-        raw = (value or "").strip().lower()
-
-        if not raw:
-            return "unknown"
-
-        unavailable_terms = [
-            "unavailable", "not available", "booked", "busy", "full", "cannot", "can't",
-            "off", "no availability", "not free"
-        ]
-        limited_terms = [
-            "limited", "part-time", "part time", "weekend", "weekends", "evening",
-            "evenings", "after", "partial", "some days", "select days", "certain days"
-        ]
-        ready_terms = [
-            "ready", "available", "open", "flexible", "full-time", "full time",
-            "anytime", "open availability", "immediate"
-        ]
-
-        for term in unavailable_terms:
-            if term in raw:
-                return "unavailable"
-
-        for term in limited_terms:
-            if term in raw:
-                return "limited"
-
-        for term in ready_terms:
-            if term in raw:
-                return "ready"
-
-        return "limited"
-
-    def parse_certification_tags(value: str | None) -> list[str]:
-        raw = (value or "").strip()
-        if not raw:
-            return []
-
-        normalized = raw.replace(";", ",").replace("|", ",")
-        tags = []
-
-        for part in normalized.split(","):
-            item = part.strip()
-            if item and item not in tags:
-                tags.append(item)
-
-        return tags[:12]
-
-    def detect_common_skill_flags(tags: list[str]) -> list[str]:
-        joined = " | ".join(tags).lower()
-        flags = []
-
-        checks = [
-            ("OSHA", ["osha"]),
-            ("Forklift", ["forklift"]),
-            ("Rigging", ["rigging", "rigger"]),
-            ("Lift Cert", ["scissor", "boom lift", "lift cert"]),
-            ("ETCP", ["etcp"]),
-            ("CDL", ["cdl"]),
-            ("Audio", ["audio", "a1", "a2"]),
-            ("Video", ["video", "v1", "v2"]),
-            ("Lighting", ["lighting", "lx", "l1", "l2"]),
-            ("Stagehand", ["stagehand"]),
-        ]
-
-        for label, needles in checks:
-            if any(needle in joined for needle in needles):
-                flags.append(label)
-
-        return flags
-
-    def build_match_result(primary_role: str | None, market_area: str | None, availability: str | None, certification_tags: list[str], skill_flags: list[str]) -> dict:
-        role = (primary_role or "").strip()
-        market = (market_area or "").strip()
-        readiness = normalize_dispatch_readiness(availability)
-
-        score = 0
-        labels = []
-        next_move = "Complete worker profile"
-
-        if role:
-            score += 40
-        if market:
-            score += 20
-
-        if readiness == "ready":
-            score += 25
-            labels.append("Ready Now")
-            next_move = "Open Worker Dashboard"
-        elif readiness == "limited":
-            score += 10
-            labels.append("Limited Availability")
-            next_move = "Clarify availability for dispatch"
-        elif readiness == "unavailable":
-            labels.append("Currently Unavailable")
-            next_move = "Update availability before dispatch"
-        else:
-            labels.append("Availability Needs Clarification")
-            next_move = "Add clearer availability"
-
-        if certification_tags or skill_flags:
-            score += 15
-            labels.append("Strong Match")
-        else:
-            labels.append("Certification Opportunity")
-            if next_move == "Open Worker Dashboard":
-                next_move = "Add certifications to strengthen dispatch trust"
-
-        if not market:
-            labels.append("Market Alignment Needed")
-            next_move = "Add market area for stronger matching"
-
-        score = max(0, min(score, 100))
-
-        return {
-            "match_score": score,
-            "match_labels": labels,
-            "next_move": next_move,
-        }
-
     latest_worker = {}
     for existing in reversed(LABOR_SUBMISSIONS):
         if existing.get("nc_worker_id"):
@@ -1464,77 +1593,6 @@ def labor_match_review(request: Request):
 
 @app.get("/labor/dashboard", response_class=HTMLResponse)
 def labor_dashboard(request: Request):
-    def normalize_dispatch_readiness(value: str | None) -> str:
-        raw = (value or "").strip().lower()
-
-        if not raw:
-            return "unknown"
-
-        unavailable_terms = [
-            "unavailable", "not available", "booked", "busy", "full", "cannot", "can't",
-            "off", "no availability", "not free"
-        ]
-        limited_terms = [
-            "limited", "part-time", "part time", "weekend", "weekends", "evening",
-            "evenings", "after", "partial", "some days", "select days", "certain days"
-        ]
-        ready_terms = [
-            "ready", "available", "open", "flexible", "full-time", "full time",
-            "anytime", "open availability", "immediate"
-        ]
-
-        for term in unavailable_terms:
-            if term in raw:
-                return "unavailable"
-
-        for term in limited_terms:
-            if term in raw:
-                return "limited"
-
-        for term in ready_terms:
-            if term in raw:
-                return "ready"
-
-        return "limited"
-
-    def parse_certification_tags(value: str | None) -> list[str]:
-        raw = (value or "").strip()
-        if not raw:
-            return []
-
-        normalized = raw.replace(";", ",").replace("|", ",")
-        tags = []
-
-        for part in normalized.split(","):
-            item = part.strip()
-            if item and item not in tags:
-                tags.append(item)
-
-        return tags[:12]
-
-    def detect_common_skill_flags(tags: list[str]) -> list[str]:
-        joined = " | ".join(tags).lower()
-        flags = []
-
-        checks = [
-            ("OSHA", ["osha"]),
-            ("Forklift", ["forklift"]),
-            ("Rigging", ["rigging", "rigger"]),
-            ("Lift Cert", ["scissor", "boom lift", "lift cert"]),
-            ("ETCP", ["etcp"]),
-            ("CDL", ["cdl"]),
-            ("Audio", ["audio", "a1", "a2"]),
-            ("Video", ["video", "v1", "v2"]),
-            ("Lighting", ["lighting", "lx", "l1", "l2"]),
-            ("Stagehand", ["stagehand"]),
-        ]
-
-        for label, needles in checks:
-            if any(needle in joined for needle in needles):
-                flags.append(label)
-
-        return flags
-
     latest = None
     for existing in reversed(LABOR_SUBMISSIONS):
         if existing.get("nc_worker_id"):
@@ -1591,77 +1649,6 @@ def labor_dashboard(request: Request):
 
 @app.get("/labor/profile/summary", response_class=HTMLResponse)
 def labor_profile_summary(request: Request):
-    def normalize_dispatch_readiness(value: str | None) -> str:
-        raw = (value or "").strip().lower()
-
-        if not raw:
-            return "unknown"
-
-        unavailable_terms = [
-            "unavailable", "not available", "booked", "busy", "full", "cannot", "can't",
-            "off", "no availability", "not free"
-        ]
-        limited_terms = [
-            "limited", "part-time", "part time", "weekend", "weekends", "evening",
-            "evenings", "after", "partial", "some days", "select days", "certain days"
-        ]
-        ready_terms = [
-            "ready", "available", "open", "flexible", "full-time", "full time",
-             "anytime", "open availability", "immediate"
-        ]
-
-        for term in unavailable_terms:
-            if term in raw:
-                return "unavailable"
-
-        for term in limited_terms:
-            if term in raw:
-                return "limited"
-
-        for term in ready_terms:
-            if term in raw:
-                return "ready"
-
-        return "limited"
-
-    def parse_certification_tags(value: str | None) -> list[str]:
-        raw = (value or "").strip()
-        if not raw:
-            return []
-
-        normalized = raw.replace(";", ",").replace("|", ",")
-        tags = []
-
-        for part in normalized.split(","):
-            item = part.strip()
-            if item and item not in tags:
-                tags.append(item)
-
-        return tags[:12]
-
-    def detect_common_skill_flags(tags: list[str]) -> list[str]:
-        joined = " | ".join(tags).lower()
-        flags = []
-
-        checks = [
-            ("OSHA", ["osha"]),
-            ("Forklift", ["forklift"]),
-            ("Rigging", ["rigging", "rigger"]),
-            ("Lift Cert", ["scissor", "boom lift", "lift cert"]),
-            ("ETCP", ["etcp"]),
-            ("CDL", ["cdl"]),
-            ("Audio", ["audio", "a1", "a2"]),
-            ("Video", ["video", "v1", "v2"]),
-            ("Lighting", ["lighting", "lx", "l1", "l2"]),
-            ("Stagehand", ["stagehand"]),
-        ]
-
-        for label, needles in checks:
-            if any(needle in joined for needle in needles):
-                flags.append(label)
-
-        return flags
-
     latest = None
 
     for existing in reversed(LABOR_SUBMISSIONS):
@@ -1828,6 +1815,9 @@ async def labor_profile_edit_submit(
             updated = True
             break
 
+    if updated:
+        rebuild_labor_index()
+
     return render(
         request,
         "submission_success.html",
@@ -1848,12 +1838,13 @@ async def labor_profile_edit_submit(
 
 @app.get("/labor/profile/start", response_class=HTMLResponse)
 def labor_profile_start(request: Request):
-    return render(request, "labor_profile_start.html")
+    return render_static_page(request, "labor_profile_start.html")
 
 
 @app.post("/labor/profile/start", response_class=HTMLResponse)
 async def labor_profile_start_submit(
     request: Request,
+    background_tasks: BackgroundTasks,
     email: str = Form(""),
     phone: str = Form(""),
     primary_role: str = Form(""),
@@ -1861,28 +1852,14 @@ async def labor_profile_start_submit(
     certifications: str = Form(""),
     availability: str = Form(""),
 ):
-    nc_worker_id = None
-    normalized_email = (email or "").strip().lower()
-    normalized_phone = (phone or "").strip()
-
-    for existing in LABOR_SUBMISSIONS:
-        existing_email = (existing.get("email") or "").strip().lower()
-        existing_phone = (existing.get("phone") or "").strip()
-
-        if normalized_email and existing_email == normalized_email:
-            nc_worker_id = existing.get("nc_worker_id")
-            break
-
-        if normalized_phone and existing_phone == normalized_phone:
-            nc_worker_id = existing.get("nc_worker_id")
-            break
-
+    nc_worker_id = find_labor_worker_id(email, phone)
     if not nc_worker_id:
         nc_worker_id = f"wrk_{uuid4().hex}"
 
     cert_list = [c.strip() for c in (certifications or "").replace(";", ",").split(",") if c.strip()]
 
-    CareerDNALedger().record(
+    background_tasks.add_task(
+        CareerDNALedger().record,
         worker_id=nc_worker_id,
         event_type="career_dna_profile_started",
         role=primary_role or None,
@@ -1917,22 +1894,13 @@ async def labor_profile_start_submit(
 @app.get("/intake/labor", response_class=HTMLResponse)
 def intake_labor(request: Request):
 
-    return render(request, "intake_form.html")
-
-    return render(
-        request,
-        "intake_form.html",
-        {
-            "token": "",
-            "email": "",
-        },
-    )
-
+    return render_static_page(request, "intake_form.html")
 
 
 @app.post("/intake/labor")
 async def intake_labor_submit(
     request: Request,
+    background_tasks: BackgroundTasks,
     full_name: str = Form(""),
     email: str = Form(""),
     phone: str = Form(""),
@@ -1944,25 +1912,10 @@ async def intake_labor_submit(
     notes: str = Form(""),
     files: list[UploadFile] = File(default=[]),
 ):
-    saved_files = save_uploads(files, LABOR_UPLOADS)
+    saved_files = await run_in_threadpool(save_uploads, files, LABOR_UPLOADS)
     submission_id = len(LABOR_SUBMISSIONS) + 1
 
-    nc_worker_id = None
-    normalized_email = (email or "").strip().lower()
-    normalized_phone = (phone or "").strip()
-
-    for existing in LABOR_SUBMISSIONS:
-        existing_email = (existing.get("email") or "").strip().lower()
-        existing_phone = (existing.get("phone") or "").strip()
-
-        if normalized_email and existing_email == normalized_email:
-            nc_worker_id = existing.get("nc_worker_id")
-            break
-
-        if normalized_phone and existing_phone == normalized_phone:
-            nc_worker_id = existing.get("nc_worker_id")
-            break
-
+    nc_worker_id = find_labor_worker_id(email, phone)
     if not nc_worker_id:
         nc_worker_id = f"wrk_{uuid4().hex}"
 
@@ -1983,10 +1936,12 @@ async def intake_labor_submit(
             "created_at": int(time.time()),
         }
     )
+    index_labor_submission(len(LABOR_SUBMISSIONS) - 1, LABOR_SUBMISSIONS[-1])
 
     cert_list = [c.strip() for c in (certifications or "").replace(";", ",").split(",") if c.strip()]
 
-    CareerDNALedger().record(
+    background_tasks.add_task(
+        CareerDNALedger().record,
         worker_id=nc_worker_id,
         event_type="labor_profile_submitted",
         role=primary_role or None,
@@ -2024,7 +1979,7 @@ async def intake_labor_submit(
 
 @app.get("/modules/case-dock", response_class=HTMLResponse)
 def case_dock(request: Request):
-    return render(request, "case_dock.html")
+    return render_static_page(request, "case_dock.html")
 
 
 @app.post("/modules/case-dock")
@@ -2039,62 +1994,63 @@ async def case_dock_submit(
     requested_outcome: str = Form(""),
     files: list[UploadFile] = File(default=[]),
 ):
-    with db_conn() as conn:
-        next_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM cases").fetchone()[0]
-
-    saved_files = save_uploads(files, CASE_DOCK_UPLOADS)
-
-    case_data = {
-        "id": next_id,
-        "matter_title": matter_title,
-        "jurisdiction": jurisdiction,
-        "issue_type": issue_type,
-        "parties": parties,
-        "timeline": timeline,
-        "summary": summary,
-        "requested_outcome": requested_outcome,
-        "files": saved_files,
-        "created_at": int(time.time()),
-    }
+    saved_files = await run_in_threadpool(save_uploads, files, CASE_DOCK_UPLOADS)
+
+    async with CASE_WRITE_LOCK:
+        next_id = await run_in_threadpool(next_case_id)
+        now = int(time.time())
+
+        case_data = {
+            "id": next_id,
+            "matter_title": matter_title,
+            "jurisdiction": jurisdiction,
+            "issue_type": issue_type,
+            "parties": parties,
+            "timeline": timeline,
+            "summary": summary,
+            "requested_outcome": requested_outcome,
+            "files": saved_files,
+            "created_at": now,
+        }
 
-    route_data = infer_case_route(case_data)
-    route_data["module_state"] = {
-        "case_dock": {
-            "status": "complete",
-            "completed_at": int(time.time()),
-            "snapshot": {
-                "matter_title": matter_title,
-                "jurisdiction": jurisdiction,
-                "issue_type": issue_type,
-                "requested_outcome": requested_outcome,
-                "parties": parties,
-                "timeline": timeline,
-                "summary": summary,
-                "file_count": len(saved_files),
+        route_data = infer_case_route(case_data)
+        route_data["module_state"] = {
+            "case_dock": {
+                "status": "complete",
+                "completed_at": now,
+                "snapshot": {
+                    "matter_title": matter_title,
+                    "jurisdiction": jurisdiction,
+                    "issue_type": issue_type,
+                    "requested_outcome": requested_outcome,
+                    "parties": parties,
+                    "timeline": timeline,
+                    "summary": summary,
+                    "file_count": len(saved_files),
+                },
             },
-        },
-        "signal_dock": {
-            "status": "pending",
-            "completed_at": None,
-            "review": {},
-        },
-        "equity_engine": {
-            "status": "pending",
-            "completed_at": None,
-            "review": {},
-        },
-    }
-    compliance_gate = build_compliance_gate(request, case_data, route_data)
-    route_data["compliance_gate"] = compliance_gate
+            "signal_dock": {
+                "status": "pending",
+                "completed_at": None,
+                "review": {},
+            },
+            "equity_engine": {
+                "status": "pending",
+                "completed_at": None,
+                "review": {},
+            },
+        }
+        compliance_gate = build_compliance_gate(request, case_data, route_data, now)
+        route_data["compliance_gate"] = compliance_gate
 
-    case_folder_name, generated_docs = write_case_folder(case_data, saved_files, route_data)
+        case_folder_name, generated_docs = await run_in_threadpool(write_case_folder, case_data, saved_files, route_data)
 
-    case_data["route"] = route_data
-    case_data["case_folder_name"] = case_folder_name
-    case_data["generated_docs"] = generated_docs
-    case_data["compliance_gate"] = compliance_gate
+        case_data["route"] = route_data
+        case_data["case_folder_name"] = case_folder_name
+        case_data["generated_docs"] = generated_docs
+        case_data["compliance_gate"] = compliance_gate
 
-    store_case_record(case_data)
+        await run_in_threadpool(store_case_record, case_data)
 
     return render(
         request,
@@ -2130,71 +2086,72 @@ async def case_update_submit(
     updated_requested_outcome: str = Form(""),
     files: list[UploadFile] = File(default=[]),
 ):
-    case_context = fetch_latest_case()
-    if not case_context:
-        return RedirectResponse("/modules/case-dock", status_code=303)
-
-    saved_files = save_uploads(files, CASE_DOCK_UPLOADS)
-
-    updated_summary = case_context.get("summary", "")
-    if additional_facts.strip():
-        updated_summary = f"{updated_summary}\n\nSUPPLEMENTAL FACTS\n{additional_facts}".strip()
-
-    updated_timeline = case_context.get("timeline", "")
-    if additional_timeline.strip():
-        updated_timeline = f"{updated_timeline}\n\nSUPPLEMENTAL TIMELINE NOTES\n{additional_timeline}".strip()
-
-    requested_outcome = case_context.get("requested_outcome", "")
-    if updated_requested_outcome.strip():
-        requested_outcome = updated_requested_outcome.strip()
-
-    merged_files = list(case_context.get("files", [])) + saved_files
-
-    case_data = {
-        "id": case_context["id"],
-        "matter_title": case_context["matter_title"],
-        "jurisdiction": case_context["jurisdiction"],
-        "issue_type": case_context["issue_type"],
-        "parties": case_context["parties"],
-        "timeline": updated_timeline,
-        "summary": updated_summary,
-        "requested_outcome": requested_outcome,
-        "files": merged_files,
-        "created_at": case_context["created_at"],
-    }
+    async with CASE_WRITE_LOCK:
+        case_context = await run_in_threadpool(fetch_latest_case)
+        if not case_context:
+            return RedirectResponse("/modules/case-dock", status_code=303)
+
+        saved_files = await run_in_threadpool(save_uploads, files, CASE_DOCK_UPLOADS)
+
+        updated_summary = case_context.get("summary", "")
+        if additional_facts.strip():
+            updated_summary = f"{updated_summary}\n\nSUPPLEMENTAL FACTS\n{additional_facts}".strip()
+
+        updated_timeline = case_context.get("timeline", "")
+        if additional_timeline.strip():
+            updated_timeline = f"{updated_timeline}\n\nSUPPLEMENTAL TIMELINE NOTES\n{additional_timeline}".strip()
+
+        requested_outcome = case_context.get("requested_outcome", "")
+        if updated_requested_outcome.strip():
+            requested_outcome = updated_requested_outcome.strip()
+
+        merged_files = list(case_context.get("files", [])) + saved_files
+
+        case_data = {
+            "id": case_context["id"],
+            "matter_title": case_context["matter_title"],
+            "jurisdiction": case_context["jurisdiction"],
+            "issue_type": case_context["issue_type"],
+            "parties": case_context["parties"],
+            "timeline": updated_timeline,
+            "summary": updated_summary,
+            "requested_outcome": requested_outcome,
+            "files": merged_files,
+            "created_at": case_context["created_at"],
+        }
 
-    route_data = infer_case_route(case_data)
-    existing_module_state = case_context.get("route", {}).get("module_state", {})
-    route_data["module_state"] = merge_route_module_state(
-        existing_module_state,
-        {
-            "case_dock": {
-                "status": "complete",
-                "completed_at": existing_module_state.get("case_dock", {}).get("completed_at") or case_context.get("created_at"),
-                "snapshot": {
-                    "matter_title": case_data["matter_title"],
-                    "jurisdiction": case_data["jurisdiction"],
-                    "issue_type": case_data["issue_type"],
-                    "requested_outcome": case_data["requested_outcome"],
-                    "parties": case_data["parties"],
-                    "timeline": case_data["timeline"],
-                    "summary": case_data["summary"],
-                    "file_count": len(merged_files),
-                },
-            }
-        },
-    )
-    compliance_gate = build_compliance_gate(request, case_data, route_data)
-    route_data["compliance_gate"] = compliance_gate
+        route_data = infer_case_route(case_data)
+        existing_module_state = case_context.get("route", {}).get("module_state", {})
+        route_data["module_state"] = merge_route_module_state(
+            existing_module_state,
+            {
+                "case_dock": {
+                    "status": "complete",
+                    "completed_at": existing_module_state.get("case_dock", {}).get("completed_at") or case_context.get("created_at"),
+                    "snapshot": {
+                        "matter_title": case_data["matter_title"],
+                        "jurisdiction": case_data["jurisdiction"],
+                        "issue_type": case_data["issue_type"],
+                        "requested_outcome": case_data["requested_outcome"],
+                        "parties": case_data["parties"],
+                        "timeline": case_data["timeline"],
+                        "summary": case_data["summary"],
+                        "file_count": len(merged_files),
+                    },
+                }
+            },
+        )
+        compliance_gate = build_compliance_gate(request, case_data, route_data)
+        route_data["compliance_gate"] = compliance_gate
 
-    case_folder_name, generated_docs = write_case_folder(case_data, merged_files, route_data)
+        case_folder_name, generated_docs = await run_in_threadpool(write_case_folder, case_data, merged_files, route_data)
 
-    case_data["route"] = route_data
-    case_data["case_folder_name"] = case_folder_name
-    case_data["generated_docs"] = generated_docs
-    case_data["compliance_gate"] = compliance_gate
+        case_data["route"] = route_data
+        case_data["case_folder_name"] = case_folder_name
+        case_data["generated_docs"] = generated_docs
+        case_data["compliance_gate"] = compliance_gate
 
-    update_case_record(case_data)
+        await run_in_threadpool(update_case_record, case_data)
 
     return render(
         request,
@@ -2230,85 +2187,78 @@ async def signal_dock_submit(
     risk_flags: str = Form(""),
     signal_summary: str = Form(""),
 ):
-    case_context = fetch_latest_case()
-    if not case_context:
-        return RedirectResponse("/modules/case-dock", status_code=303)
-
-    signal_block_parts = []
-    if critical_deadlines.strip():
-        signal_block_parts.append(f"CRITICAL DEADLINES\n{critical_deadlines.strip()}")
-    if notice_signals.strip():
-        signal_block_parts.append(f"NOTICE SIGNALS\n{notice_signals.strip()}")
-    if risk_flags.strip():
-        signal_block_parts.append(f"RISK FLAGS\n{risk_flags.strip()}")
-    if signal_summary.strip():
-        signal_block_parts.append(f"SIGNAL SUMMARY\n{signal_summary.strip()}")
-
-    signal_block = "\n\n".join(signal_block_parts)
-
-    updated_summary = case_context.get("summary", "")
-    if signal_block:
-        updated_summary = f"{updated_summary}\n\nSIGNAL DOCK REVIEW\n{signal_block}".strip()
-
-    signal_review = {
-        "critical_deadlines": critical_deadlines.strip(),
-        "notice_signals": notice_signals.strip(),
-        "risk_flags": risk_flags.strip(),
-        "signal_summary": signal_summary.strip(),
-    }
+    async with CASE_WRITE_LOCK:
+        case_context = await run_in_threadpool(fetch_latest_case)
+        if not case_context:
+            return RedirectResponse("/modules/case-dock", status_code=303)
+
+        signal_review = {
+            "critical_deadlines": critical_deadlines.strip(),
+            "notice_signals": notice_signals.strip(),
+            "risk_flags": risk_flags.strip(),
+            "signal_summary": signal_summary.strip(),
+        }
+        signal_block = "\n\n".join(
+            f"{label}\n{signal_review[field]}" for field, label in SIGNAL_REVIEW_SECTIONS if signal_review[field]
+        )
 
-    case_data = {
-        "id": case_context["id"],
-        "matter_title": case_context["matter_title"],
-        "jurisdiction": case_context["jurisdiction"],
-        "issue_type": case_context["issue_type"],
-        "parties": case_context["parties"],
-        "timeline": case_context["timeline"],
-        "summary": updated_summary,
-        "requested_outcome": case_context["requested_outcome"],
-        "files": case_context.get("files", []),
-        "created_at": case_context["created_at"],
-    }
+        updated_summary = case_context.get("summary", "")
+        if signal_block:
+            updated_summary = f"{updated_summary}\n\nSIGNAL DOCK REVIEW\n{signal_block}".strip()
+
+        case_data = {
+            "id": case_context["id"],
+            "matter_title": case_context["matter_title"],
+            "jurisdiction": case_context["jurisdiction"],
+            "issue_type": case_context["issue_type"],
+            "parties": case_context["parties"],
+            "timeline": case_context["timeline"],
+            "summary": updated_summary,
+            "requested_outcome": case_context["requested_outcome"],
+            "files": case_context.get("files", []),
+            "created_at": case_context["created_at"],
+        }
 
-    route_data = infer_case_route(case_data)
-    existing_module_state = case_context.get("route", {}).get("module_state", {})
-    route_data["module_state"] = merge_route_module_state(
-        existing_module_state,
-        {
-            "case_dock": existing_module_state.get("case_dock", {
-                "status": "complete",
-                "completed_at": case_context.get("created_at"),
-                "snapshot": {
-                    "matter_title": case_context["matter_title"],
-                    "jurisdiction": case_context["jurisdiction"],
-                    "issue_type": case_context["issue_type"],
-                    "requested_outcome": case_context["requested_outcome"],
-                    "parties": case_context["parties"],
-                    "timeline": case_context["timeline"],
-                    "summary": case_context.get("summary", ""),
-                    "file_count": len(case_context.get("files", [])),
+        now = int(time.time())
+        route_data = infer_case_route(case_data)
+        existing_module_state = case_context.get("route", {}).get("module_state", {})
+        route_data["module_state"] = merge_route_module_state(
+            existing_module_state,
+            {
+                "case_dock": existing_module_state.get("case_dock", {
+                    "status": "complete",
+                    "completed_at": case_context.get("created_at"),
+                    "snapshot": {
+                        "matter_title": case_context["matter_title"],
+                        "jurisdiction": case_context["jurisdiction"],
+                        "issue_type": case_context["issue_type"],
+                        "requested_outcome": case_context["requested_outcome"],
+                        "parties": case_context["parties"],
+                        "timeline": case_context["timeline"],
+                        "summary": case_context.get("summary", ""),
+                        "file_count": len(case_context.get("files", [])),
+                    },
+                }),
+                "signal_dock": {
+                    "status": "complete",
+                    "completed_at": now,
+                    "review": signal_review,
                 },
-            }),
-            "signal_dock": {
-                "status": "complete",
-                "completed_at": int(time.time()),
-                "review": signal_review,
             },
-        },
-    )
-    compliance_gate = build_compliance_gate(request, case_data, route_data)
-    route_data["compliance_gate"] = compliance_gate
+        )
+        compliance_gate = build_compliance_gate(request, case_data, route_data, now)
+        route_data["compliance_gate"] = compliance_gate
 
-    case_folder_name, generated_docs = write_case_folder(
-        case_data, case_data["files"], route_data
-    )
+        case_folder_name, generated_docs = await run_in_threadpool(
+            write_case_folder, case_data, case_data["files"], route_data
+        )
 
-    case_data["route"] = route_data
-    case_data["case_folder_name"] = case_folder_name
-    case_data["generated_docs"] = generated_docs
-    case_data["compliance_gate"] = compliance_gate
+        case_data["route"] = route_data
+        case_data["case_folder_name"] = case_folder_name
+        case_data["generated_docs"] = generated_docs
+        case_data["compliance_gate"] = compliance_gate
 
-    update_case_record(case_data)
+        await run_in_threadpool(update_case_record, case_data)
 
     return render(
         request,
@@ -2345,92 +2295,81 @@ async def equity_engine_submit(
     urgency_level: str = Form(""),
     equity_notes: str = Form(""),
 ):
-    case_context = fetch_latest_case()
-    if not case_context:
-        return RedirectResponse("/modules/case-dock", status_code=303)
-
-    equity_block_parts = []
-    if relief_sought.strip():
-        equity_block_parts.append(f"RELIEF SOUGHT\n{relief_sought.strip()}")
-    if equitable_posture.strip():
-        equity_block_parts.append(f"EQUITABLE POSTURE\n{equitable_posture.strip()}")
-    if pressure_path.strip():
-        equity_block_parts.append(f"PRESSURE PATH\n{pressure_path.strip()}")
-    if urgency_level.strip():
-        equity_block_parts.append(f"URGENCY LEVEL\n{urgency_level.strip()}")
-    if equity_notes.strip():
-        equity_block_parts.append(f"EQUITY NOTES\n{equity_notes.strip()}")
-
-    equity_block = "\n\n".join(equity_block_parts)
-
-    updated_summary = case_context.get("summary", "")
-    if equity_block:
-        updated_summary = f"{updated_summary}\n\nEQUITY ENGINE REVIEW\n{equity_block}".strip()
-
-    updated_outcome = case_context.get("requested_outcome", "")
-    if relief_sought.strip():
-        updated_outcome = relief_sought.strip()
-
-    equity_review = {
-        "relief_sought": relief_sought.strip(),
-        "equitable_posture": equitable_posture.strip(),
-        "pressure_path": pressure_path.strip(),
-        "urgency_level": urgency_level.strip(),
-        "equity_notes": equity_notes.strip(),
-    }
+    async with CASE_WRITE_LOCK:
+        case_context = await run_in_threadpool(fetch_latest_case)
+        if not case_context:
+            return RedirectResponse("/modules/case-dock", status_code=303)
+
+        equity_review = {
+            "relief_sought": relief_sought.strip(),
+            "equitable_posture": equitable_posture.strip(),
+            "pressure_path": pressure_path.strip(),
+            "urgency_level": urgency_level.strip(),
+            "equity_notes": equity_notes.strip(),
+        }
+        equity_block = "\n\n".join(
+            f"{label}\n{equity_review[field]}" for field, label in EQUITY_REVIEW_SECTIONS if equity_review[field]
+        )
 
-    case_data = {
-        "id": case_context["id"],
-        "matter_title": case_context["matter_title"],
-        "jurisdiction": case_context["jurisdiction"],
-        "issue_type": case_context["issue_type"],
-        "parties": case_context["parties"],
-        "timeline": case_context["timeline"],
-        "summary": updated_summary,
-        "requested_outcome": updated_outcome,
-        "files": case_context.get("files", []),
-        "created_at": case_context["created_at"],
-    }
+        updated_summary = case_context.get("summary", "")
+        if equity_block:
+            updated_summary = f"{updated_summary}\n\nEQUITY ENGINE REVIEW\n{equity_block}".strip()
+
+        updated_outcome = equity_review["relief_sought"] or case_context.get("requested_outcome", "")
+
+        case_data = {
+            "id": case_context["id"],
+            "matter_title": case_context["matter_title"],
+            "jurisdiction": case_context["jurisdiction"],
+            "issue_type": case_context["issue_type"],
+            "parties": case_context["parties"],
+            "timeline": case_context["timeline"],
+            "summary": updated_summary,
+            "requested_outcome": updated_outcome,
+            "files": case_context.get("files", []),
+            "created_at": case_context["created_at"],
+        }
 
-    route_data = infer_case_route(case_data)
-    existing_module_state = case_context.get("route", {}).get("module_state", {})
-    route_data["module_state"] = merge_route_module_state(
-        existing_module_state,
-        {
-            "case_dock": existing_module_state.get("case_dock", {
-                "status": "complete",
-                "completed_at": case_context.get("created_at"),
-                "snapshot": {
-                    "matter_title": case_context["matter_title"],
-                    "jurisdiction": case_context["jurisdiction"],
-                    "issue_type": case_context["issue_type"],
-                    "requested_outcome": case_context["requested_outcome"],
-                    "parties": case_context["parties"],
-                    "timeline": case_context["timeline"],
-                    "summary": case_context.get("summary", ""),
-                    "file_count": len(case_context.get("files", [])),
+        now = int(time.time())
+        route_data = infer_case_route(case_data)
+        existing_module_state = case_context.get("route", {}).get("module_state", {})
+        route_data["module_state"] = merge_route_module_state(
+            existing_module_state,
+            {
+                "case_dock": existing_module_state.get("case_dock", {
+                    "status": "complete",
+                    "completed_at": case_context.get("created_at"),
+                    "snapshot": {
+                        "matter_title": case_context["matter_title"],
+                        "jurisdiction": case_context["jurisdiction"],
+                        "issue_type": case_context["issue_type"],
+                        "requested_outcome": case_context["requested_outcome"],
+                        "parties": case_context["parties"],
+                        "timeline": case_context["timeline"],
+                        "summary": case_context.get("summary", ""),
+                        "file_count": len(case_context.get("files", [])),
+                    },
+                }),
+                "equity_engine": {
+                    "status": "complete",
+                    "completed_at": now,
+                    "review": equity_review,
                 },
-            }),
-            "equity_engine": {
-                "status": "complete",
-                "completed_at": int(time.time()),
-                "review": equity_review,
             },
-        },
-    )
-    compliance_gate = build_compliance_gate(request, case_data, route_data)
-    route_data["compliance_gate"] = compliance_gate
+        )
+        compliance_gate = build_compliance_gate(request, case_data, route_data, now)
+        route_data["compliance_gate"] = compliance_gate
 
-    case_folder_name, generated_docs = write_case_folder(
-        case_data, case_data["files"], route_data
-    )
+        case_folder_name, generated_docs = await run_in_threadpool(
+            write_case_folder, case_data, case_data["files"], route_data
+        )
 
-    case_data["route"] = route_data
-    case_data["case_folder_name"] = case_folder_name
-    case_data["generated_docs"] = generated_docs
-    case_data["compliance_gate"] = compliance_gate
+        case_data["route"] = route_data
+        case_data["case_folder_name"] = case_folder_name
+        case_data["generated_docs"] = generated_docs
+        case_data["compliance_gate"] = compliance_gate
 
-    update_case_record(case_data)
+        await run_in_threadpool(update_case_record, case_data)
 
     return render(
         request,
@@ -2459,8 +2398,9 @@ def ledger_preview_page(request: Request):
     return render(request, "ledger_preview.html", data)
 
 @app.get("/modules/labor-signal", response_class=HTMLResponse)
-def labor_signal_page(request: Request):
-    EventLedger().record(
+def labor_signal_page(request: Request, background_tasks: BackgroundTasks):
+    background_tasks.add_task(
+        EventLedger().record,
         event_type="labor_signal_page_opened",
         module="labor_signal",
         status="started",
@@ -2468,13 +2408,14 @@ def labor_signal_page(request: Request):
         route="/modules/labor-signal",
         payload={"source": "route_open"},
     )
-    CareerDNALedger().record(
+    background_tasks.add_task(
+        CareerDNALedger().record,
         worker_id="anonymous",
         event_type="profile_started",
         market="unknown",
         payload={"route": "/modules/labor-signal", "source": "route_open"},
     )
-    return render(request, "labor_signal.html")
+    return render_static_page(request, "labor_signal.html")
 
 
 @app.get("/modules/navigator-ai", response_class=HTMLResponse)
@@ -2490,13 +2431,11 @@ def draft_packet(request: Request):
 
 
 try:
-    if labor_signal_flags()["ENABLE_LABOR_SIGNAL_ENGINE"]:
+    if LABOR_SIGNAL_FLAGS["ENABLE_LABOR_SIGNAL_ENGINE"]:
         from labor_signal.router import router as labor_signal_router
         app.include_router(labor_signal_router)
 except Exception as exc:
-    print(f"[labor_signal] router not loaded: {exc}")
-
-import os
+    logger.warning("labor_signal router not loaded: %s", exc)
 
 @app.get("/system-status")
 def system_status():
@@ -2520,53 +2459,16 @@ def system_status():
         "modules_detected": modules_detected
     }
 
-@app.get("/system-status")
-def system_status():
-    stripe_keys = [
-        "STRIPE_LINK_NC_ACCESS",
-        "STRIPE_LINK_NC_PROTECTION",
-        "STRIPE_LINK_NC_COMMAND",
-        "STRIPE_LINK_LABOR_SIGNAL_BASIC",
-        "STRIPE_LINK_LABOR_SIGNAL_PRO",
-        "STRIPE_LINK_ENTRY_ACCESS",
-        "STRIPE_LINK_LEGAL_BASIC",
-        "STRIPE_LINK_FURTHER_ACTION",
-    ]
 
-    return {
-        "app_status": "running",
-        "stripe_configured": any(os.getenv(k) for k in stripe_keys),
-        "stripe_keys_present": [k for k in stripe_keys if os.getenv(k)],
-        "modules_detected": os.listdir("modules") if os.path.isdir("modules") else [],
-    }
 @app.get("/legalese")
 def legalese(request: Request):
-    return templates.TemplateResponse(
-        "legalese-practice-room/index.html",
-        {"request": request}
-    )
-
+    return render_static_page(request, "legalese-practice-room/index.html")
 
-from fastapi import Form
 
 @app.post("/legalese")
 def legalese_post(request: Request, text: str = Form(...)):
     result = f"LEGAL FORM:\n{text.upper()}"
-    return templates.TemplateResponse(
-        "legalese-practice-room/index.html",
-        {"request": request, "result": result}
-    )
-
-
-from fastapi import Form
-
-@app.post("/legalese")
-def legalese_post(request: Request, text: str = Form(...)):
-    result = f"LEGAL FORM:\n{text.upper()}"
-    return templates.TemplateResponse(
-        "legalese-practice-room/index.html",
-        {"request": request, "result": result}
-    )
+    return render(request, "legalese-practice-room/index.html", {"result": result})
 
 
 # --- Modular Services Catalog ---
@@ -2577,32 +2479,38 @@ except Exception:
 
 @app.get("/services", response_class=HTMLResponse)
 def services_page(request: Request):
-    return templates.TemplateResponse(
-        "services.html",
-        {"request": request, "service_groups": SERVICE_GROUPS}
-    )
+    return render_static_page(request, "services.html", {"service_groups": SERVICE_GROUPS})
+
+# slug -> (group, name, description), so detail pages are one dict lookup.
+SERVICE_INDEX = {
+    slug: (group, name, description)
+    for group, services in SERVICE_GROUPS.items()
+    for slug, name, description in services
+}
 
 @app.get("/services/{service_slug}", response_class=HTMLResponse)
 def service_detail(request: Request, service_slug: str):
-    for group, services in SERVICE_GROUPS.items():
-        for slug, name, description in services:
-            if slug == service_slug:
-                return templates.TemplateResponse(
-                    "services/detail.html",
-                    {
-                        "request": request,
-                        "service_name": name,
-                        "service_description": description,
-                        "service_group": group,
-                    }
-                )
-    return templates.TemplateResponse(
+    service = SERVICE_INDEX.get(service_slug)
+    if service is not None:
+        group, name, description = service
+        return render(
+            request,
+            "services/detail.html",
+            {
+                "service_name": name,
+                "service_description": description,
+                "service_group": group,
+            },
+        )
+
+    response = render(
+        request,
         "services/detail.html",
         {
-            "request": request,
             "service_name": "Service Not Found",
             "service_description": "This service route is not registered yet.",
             "service_group": "Unknown",
         },
-        status_code=404
     )
+    response.status_code = 404
+    return response
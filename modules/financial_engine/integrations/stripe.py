@@ -9,6 +9,10 @@ from typing import Any, Dict, Optional
 
 import requests
 
+# Shared across instances so repeat calls reuse the pooled TLS connection
+# to api.stripe.com instead of handshaking each time.
+HTTP_SESSION = requests.Session()
+
 
 class StripeIntegration:
     """Handles Stripe-related integration calls."""
@@ -32,3 +36,47 @@ class StripeIntegration:
             "configured": self.is_configured(),
             "base_url": self.base_url,
         }
+
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Accept": "application/json",
+        }
+
+    def request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if not self.is_configured():
+            return {
+                "ok": False,
+                "error": "Stripe is not configured. Missing STRIPE_SECRET_KEY or STRIPE_API_BASE_URL.",
+            }
+
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        method = method.upper()
+        try:
+            # Stripe takes form-encoded bodies, not JSON.
+            response = HTTP_SESSION.request(
+                method=method,
+                url=url,
+                headers=self._headers(),
+                params=payload if method == "GET" else None,
+                data=None if method == "GET" else payload,
+                timeout=self.timeout,
+            )
+            content_type = response.headers.get("Content-Type", "")
+            body: Any
+
+            if "application/json" in content_type:
+                body = response.json()
+            else:
+                body = response.text
+
+            return {
+                "ok": response.ok,
+                "status_code": response.status_code,
+                "data": body,
+            }
+        except requests.RequestException as exc:
+            return {
+                "ok": False,
+                "error": str(exc),
+            }
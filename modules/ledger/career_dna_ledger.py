@@ -4,6 +4,8 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .jsonl_tail import tail_jsonl
+
 class CareerDNALedger:
     """Worker living record ledger."""
 
@@ -47,6 +49,4 @@ class CareerDNALedger:
         return entry
 
     def tail(self, limit: int = 20) -> List[Dict[str, Any]]:
-        if not self.path.exists():
-            return []
-        return [json.loads(x) for x in self.path.read_text(encoding="utf-8").splitlines()[-limit:] if x.strip()]
+        return tail_jsonl(self.path, limit)
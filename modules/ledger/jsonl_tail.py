@@ -0,0 +1,26 @@
+from __future__ import annotations
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+_BLOCK_SIZE = 8192
+
+
+def tail_jsonl(path: Path, limit: int) -> List[Dict[str, Any]]:
+    """Return the last `limit` entries of a JSONL ledger, reading back from the end."""
+    if limit <= 0 or not path.exists():
+        return []
+
+    with path.open("rb") as f:
+        pos = f.seek(0, 2)
+        data = b""
+        while pos > 0 and data.count(b"\n") <= limit:
+            step = min(_BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+
+    lines = data.splitlines()
+    if pos > 0:
+        lines = lines[1:]
+    return [json.loads(x) for x in lines[-limit:] if x.strip()]
@@ -4,6 +4,8 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .jsonl_tail import tail_jsonl
+
 class ReferralLedger:
     """Referral and lineage memory."""
 
@@ -37,6 +39,4 @@ class ReferralLedger:
         return entry
 
     def tail(self, limit: int = 20) -> List[Dict[str, Any]]:
-        if not self.path.exists():
-            return []
-        return [json.loads(x) for x in self.path.read_text(encoding="utf-8").splitlines()[-limit:] if x.strip()]
+        return tail_jsonl(self.path, limit)